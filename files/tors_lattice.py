@@ -21,12 +21,250 @@ Requirement: SageMath ver 9.x or later
 #
 # Any feedback is welcome!
 # *****************************************************************************
+from weakref import WeakKeyDictionary, WeakValueDictionary
+import numpy as np
 import sage.all
 from sage.misc.cachefunc import cached_method
 from sage.combinat.posets.lattices import FiniteLatticePoset, LatticePoset
 from sage.combinat.posets.posets import Poset
 from sage.homology.simplicial_complex import SimplicialComplex
 
+def _pack_rows(mat):
+    r"""
+    Pack each row of a 2-dimensional Boolean array into a bitset
+
+    INPUT:
+
+    - ``mat`` -- a 2-dimensional array of Booleans
+
+    OUTPUT:
+
+    a 2-dimensional array of ``numpy.uint64`` whose ``i``-th row is a bitset
+    such that the ``j``-th bit is set if and only if ``mat[i,j]`` is ``True``
+    """
+    mat = np.asarray(mat, dtype = bool)
+    n_rows, n_cols = mat.shape
+    n_words = max(1, -(-n_cols // 64))
+    padded = np.zeros((n_rows, 64 * n_words), dtype = bool)
+    padded[:, :n_cols] = mat
+    return np.packbits(padded, axis = 1, bitorder = "little").view(np.uint64)
+
+def _bits(row):
+    r"""
+    Return the array of indices of set bits of a bitset ``row``
+
+    INPUT:
+
+    - ``row`` -- a 1-dimensional array of ``numpy.uint64``,
+      e.g. a row of an output of :func:`_pack_rows`
+    """
+    row = np.ascontiguousarray(row)
+    return np.flatnonzero(np.unpackbits(row.view(np.uint8), bitorder = "little"))
+
+def _column(bms, j):
+    r"""
+    Return whether the ``j``-th bit is set in each bitset of ``bms``
+
+    INPUT:
+
+    - ``bms`` -- an array of ``numpy.uint64`` whose rows are bitsets
+
+    - ``j`` -- a non-negative integer
+
+    OUTPUT:
+
+    an array of Booleans, or a Boolean if ``bms`` is a single bitset
+    """
+    # Read through bytes as in :func:`_bits`, which does not depend on endianness.
+    bytes_ = np.ascontiguousarray(bms).view(np.uint8)
+    return (bytes_[..., j >> 3] >> (j & 7) & 1).astype(bool)
+
+def _unpack_rows(bms, n_bits):
+    r"""
+    Unpack an array of bitsets into a 2-dimensional Boolean array
+
+    This is the inverse of :func:`_pack_rows`.
+
+    INPUT:
+
+    - ``bms`` -- a 2-dimensional array of ``numpy.uint64`` whose rows are bitsets
+
+    - ``n_bits`` -- the number of meaningful bits in each row
+    """
+    return np.unpackbits(np.ascontiguousarray(bms).view(np.uint8), axis = 1,
+                         count = n_bits, bitorder = "little").astype(bool)
+
+def _order_bitsets(n, upper_covers):
+    r"""
+    Return the up-sets of all vertices of a Hasse diagram as bitsets
+
+    Since vertices of a Hasse diagram form a linear extension,
+    the up-set of ``i`` is ``i`` together with the union of
+    the up-sets of its upper covers, which are computed before ``i``
+    if we walk vertices in reverse order.
+
+    INPUT:
+
+    - ``n`` -- the number of vertices
+
+    - ``upper_covers`` -- a list whose ``i``-th entry is
+      the list of upper covers of the ``i``-th vertex
+
+    OUTPUT:
+
+    an array of bitsets of the same form as :meth:`FiniteTorsLattice._leq_bm`
+    """
+    leq_bm = np.zeros((n, max(1, -(-n // 64))), dtype = np.uint64)
+    leq_bytes = leq_bm.view(np.uint8)
+    for i in reversed(range(n)):
+        for c in upper_covers[i]:
+            leq_bm[i] |= leq_bm[c]
+        leq_bytes[i, i >> 3] |= np.uint8(1 << (i & 7))
+    return leq_bm
+
+def _nonzero_bits(bms, n_bits):
+    r"""
+    Return the positions of all set bits in an array of bitsets
+
+    INPUT:
+
+    - ``bms`` -- a 2-dimensional array of ``numpy.uint64`` whose rows are bitsets
+
+    - ``n_bits`` -- the number of meaningful bits in each row
+
+    OUTPUT:
+
+    a pair ``(I, J)`` of arrays such that the ``J[k]``-th bit of
+    ``bms[I[k]]`` is set for each ``k``
+    """
+    return np.nonzero(_unpack_rows(bms, n_bits))
+
+def _subset_matrix(bms):
+    r"""
+    Return the inclusion relation among bitsets
+
+    INPUT:
+
+    - ``bms`` -- a 2-dimensional array of ``numpy.uint64`` whose rows are bitsets
+
+    OUTPUT:
+
+    a 2-dimensional array of Booleans whose ``(a,b)``-entry is ``True``
+    if and only if the bitset ``bms[a]`` is contained in ``bms[b]``
+    """
+    subset = np.empty((len(bms), len(bms)), dtype = bool)
+    for a, bm in enumerate(bms):
+        subset[a] = ((bms & bm) == bm).all(axis = 1)
+    return subset
+
+def _cover_matrix(less):
+    r"""
+    Return the cover relations of a strict partial order
+
+    INPUT:
+
+    - ``less`` -- a 2-dimensional array of Booleans representing
+      a strict partial order, i.e. irreflexive and transitive
+
+    OUTPUT:
+
+    a 2-dimensional array of Booleans whose ``(a,b)``-entry is ``True``
+    if and only if ``b`` covers ``a``
+    """
+    covers = np.empty_like(less)
+    for a, above in enumerate(less):
+        covers[a] = above & ~less[above].any(axis = 0)
+    return covers
+
+class _HasseTables(dict):
+    r"""
+    A dictionary of tables returned by :func:`_hasse_tables`,
+    which can be weakly referenced
+    """
+    __slots__ = ("__weakref__",)
+
+# The tables of :func:`_hasse_tables` for each Hasse diagram.
+# An entry is discarded when no lattice refers to it anymore.
+_hasse_tables_cache = WeakValueDictionary()
+
+def _hasse_tables(hasse):
+    r"""
+    Return the tables of bitsets which depend only on the Hasse diagram
+    of a finite semidistributive lattice
+
+    The tables are shared among lattices with the same vertices and
+    cover relations as long as one of them is alive,
+    and they are freed together with the last such lattice.
+
+    INPUT:
+
+    - ``hasse`` -- the Hasse diagram of a finite semidistributive lattice,
+      an instance of :class:`sage.combinat.posets.hasse_diagram.HasseDiagram`
+
+    OUTPUT:
+
+    a dictionary with the following keys:
+
+    - ``"leq_bm"``, ``"geq_bm"`` -- see :meth:`FiniteTorsLattice._leq_bm`
+      and :meth:`FiniteTorsLattice._geq_bm`
+
+    - ``"brick_vtx"``, ``"kappa_vtx"`` -- the tuples of vertices of
+      join-irreducibles and of their kappa
+
+    - ``"tors_bm"``, ``"torf_bm"`` -- see :meth:`FiniteTorsLattice._bricks_leq`
+
+    - ``"upper_cov_bm"``, ``"lower_cov_bm"`` -- see
+      :meth:`FiniteTorsLattice._upper_cov_bm` and
+      :meth:`FiniteTorsLattice._lower_cov_bm`
+    """
+    n = hasse.order()
+    key = (n, tuple(sorted(hasse.cover_relations_iterator())))
+    tables = _hasse_tables_cache.get(key)
+    if tables is not None:
+        return tables
+    leq_bm = _order_bitsets(n, [hasse.neighbors_out(i) for i in range(n)])
+    leq = _unpack_rows(leq_bm, n)
+    brick_vtx = tuple(v for v in range(n) if hasse.in_degree(v) == 1)
+    kappa_vtx = tuple(hasse.kappa(v) for v in brick_vtx)
+    cover = np.zeros((n, n), dtype = bool)
+    for i, j in key[1]:
+        cover[i, j] = True
+    tables = _HasseTables(leq_bm = leq_bm,
+                          geq_bm = _pack_rows(leq.T),
+                          brick_vtx = brick_vtx,
+                          kappa_vtx = kappa_vtx,
+                          tors_bm = _pack_rows(leq[list(brick_vtx), :].T),
+                          torf_bm = _pack_rows(leq[:, list(kappa_vtx)]),
+                          upper_cov_bm = _pack_rows(cover),
+                          lower_cov_bm = _pack_rows(cover.T))
+    for value in tables.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    _hasse_tables_cache[key] = tables
+    return tables
+
+# The memo of :func:`_kappa_vtx` for each lattice,
+# which is discarded when the lattice is garbage-collected.
+_kappa_cache = WeakKeyDictionary()
+
+def _kappa_vtx(lattice, j_vtx):
+    r"""
+    Return the vertex of `\kappa(j)` for the vertex ``j_vtx`` of
+    a join-irreducible element `j` in the Hasse diagram of ``lattice``
+
+    The result is memoized for each lattice. This is used for
+    a generic lattice; :class:`FiniteTorsLattice` reads kappa of
+    join-irreducibles from the table of :func:`_hasse_tables` instead.
+
+    OUTPUT:
+
+    a vertex of the Hasse diagram, or ``None`` if it does not exist.
+    """
+    cache = _kappa_cache.setdefault(lattice, {})
+    if j_vtx not in cache:
+        cache[j_vtx] = lattice._hasse_diagram.kappa(j_vtx)
+    return cache[j_vtx]
+
 def _kappa(lattice, j):
     r"""
     Return `\kappa(j)` for a join-irreducible element `j`
@@ -48,9 +286,8 @@ def _kappa(lattice, j):
     .. SEEALSO::
       :meth:`sage.combinat.posets.hasse_diagram.HasseDiagram.kappa`
     """
-    hasse = lattice._hasse_diagram
     j_vtx = lattice._element_to_vertex(j)
-    m_vtx = hasse.kappa(j_vtx)
+    m_vtx = _kappa_vtx(lattice, j_vtx)
     if m_vtx is None:
         return None
     m = lattice._vertex_to_element(m_vtx)
@@ -85,14 +322,50 @@ def _extended_kappa(lattice, x):
        J. Pure Appl. Algebra 225 (2021), no. 9, 106642.
 
     """
-    CJR = lattice.canonical_joinands(x)
+    m_vtx = _extended_kappa_vtx(lattice, lattice._element_to_vertex(x))
+    if m_vtx is None:
+        return None
+    return lattice._vertex_to_element(m_vtx)
+
+# The memo of :func:`_canonical_joinands_table` for each lattice.
+_cjr_cache = WeakKeyDictionary()
+
+def _canonical_joinands_table(lattice):
+    r"""
+    Return the list of canonical joinands of all elements of ``lattice``
+    in terms of vertices of the Hasse diagram
+
+    The ``i``-th entry is the tuple of vertices of the canonical joinands
+    of the ``i``-th vertex, or ``None`` if it admits no canonical join representation.
+    This is computed once for each lattice.
+    """
+    if lattice not in _cjr_cache:
+        to_vtx, elt = lattice._element_to_vertex, lattice._vertex_to_element
+        table = []
+        for i in range(lattice.cardinality()):
+            CJR = lattice.canonical_joinands(elt(i))
+            table.append(None if CJR is None else tuple(to_vtx(j) for j in CJR))
+        _cjr_cache[lattice] = table
+    return _cjr_cache[lattice]
+
+def _extended_kappa_vtx(lattice, x_vtx):
+    r"""
+    Return the vertex of :func:`_extended_kappa` of the vertex ``x_vtx``
+    of the Hasse diagram of ``lattice``, or ``None`` if it does not exist
+
+    For a :class:`FiniteTorsLattice`, this uses its vertex-based tables;
+    otherwise the meet is computed by ``lattice.meet`` on elements.
+    """
+    if isinstance(lattice, FiniteTorsLattice):
+        return lattice._kappa_idx(x_vtx)
+    CJR = _canonical_joinands_table(lattice)[x_vtx]
     if CJR is None:
         return None
-    kappa_CJR = [_kappa(lattice, j) for j in CJR]
-    try:
-        return lattice.meet(kappa_CJR)
-    except:
+    kappa_CJR = [_kappa_vtx(lattice, j) for j in CJR]
+    if any(m is None for m in kappa_CJR):
         return None
+    elt = lattice._vertex_to_element
+    return lattice._element_to_vertex(lattice.meet([elt(m) for m in kappa_CJR]))
 
 def myshow(poset, label = True, vertex_size = 100, **kwargs):
     r"""
@@ -122,7 +395,7 @@ def myshow(poset, label = True, vertex_size = 100, **kwargs):
         poset.show(label_elements= False, vertex_size = vertex_size,
                    aspect_ratio = "automatic", **kwargs)
 
-def TorsLattice(data = None, *args, **kwargs):
+def TorsLattice(data = None, *args, precompute = False, **kwargs):
     """
     Construct a lattice of torsion classes from various forms of input data
 
@@ -135,17 +408,26 @@ def TorsLattice(data = None, *args, **kwargs):
       be passed down to :func:`LatticePoset` to construct a poset that is
       also a lattice.
 
+    - ``precompute`` -- a Boolean (default: ``False``),
+      whether to compute all internal tables at once (see
+      :meth:`FiniteTorsLattice._build_all_tables`) instead of lazily,
+      which is useful for scripts handling many algebras
+
     OUTPUT:
 
     An instance of :class:`FiniteTorsLattice`
 
     """
     if isinstance(data, FiniteTorsLattice) and not args and not kwargs:
-        return data
-    L = LatticePoset(data, *args, **kwargs)
-    if not L.is_semidistributive():
-        raise ValueError("This lattice is not semidistributive.")
-    return FiniteTorsLattice(L)
+        L = data
+    else:
+        L = LatticePoset(data, *args, **kwargs)
+        if not L.is_semidistributive():
+            raise ValueError("This lattice is not semidistributive.")
+        L = FiniteTorsLattice(L)
+    if precompute:
+        L._build_all_tables()
+    return L
 
 class FiniteTorsLattice(FiniteLatticePoset):
     """
@@ -159,6 +441,23 @@ class FiniteTorsLattice(FiniteLatticePoset):
     def _repr_(self):
         return "Lattice of torsion classes of some tau-tilting finite algebra having %s torsion classes" % self._hasse_diagram.order()
 
+    def _build_all_tables(self):
+        r"""
+        Compute all internal tables used by the methods of ``self``
+
+        Each table is otherwise computed lazily when it is first needed.
+        The order relation, bricks and kappa of bricks are computed
+        together in :func:`_hasse_tables`, and the other tables reuse them.
+        """
+        self._tables()
+        self._plus_vertices()
+        self._minus_vertices()
+        self._tau_rigid_summand_bm()
+        self._non_S_serre_table()
+        self._comp_factor_bm()
+        self._kappa_vertices()
+        self._wide_lequal_matrix()
+
     @cached_method
     def zero(self):
         """
@@ -173,12 +472,166 @@ class FiniteTorsLattice(FiniteLatticePoset):
         """
         return self.top()
 
+    @cached_method
+    def _tables(self):
+        r"""
+        Return the tables of bitsets computed by :func:`_hasse_tables`
+        """
+        return _hasse_tables(self._hasse_diagram)
+
+    @cached_method
+    def _leq_mat(self):
+        r"""
+        Return the partial order of ``self`` as a Boolean matrix
+
+        We use the numbering of vertices of the Hasse diagram.
+        The ``(i,j)``-entry is ``True`` if and only if the ``i``-th element
+        is smaller than or equal to the ``j``-th element.
+        """
+        return _unpack_rows(self._leq_bm(), self.cardinality())
+
+    @cached_method
+    def _leq_bm(self):
+        r"""
+        Return the partial order of ``self`` as an array of bitsets
+
+        We use the numbering of vertices of the Hasse diagram.
+        The ``i``-th row is a bitset whose ``j``-th bit is set
+        if and only if the ``i``-th element is smaller than or equal to
+        the ``j``-th element.
+        """
+        return self._tables()["leq_bm"]
+
+    @cached_method
+    def _geq_bm(self):
+        r"""
+        Return the transpose of :meth:`_leq_bm`
+
+        The ``i``-th row is a bitset whose ``j``-th bit is set
+        if and only if the ``j``-th element is smaller than or equal to
+        the ``i``-th element.
+        """
+        return self._tables()["geq_bm"]
+
+    def _lequal_idx(self, i, j):
+        r"""
+        Return whether the ``i``-th vertex is smaller than or equal to
+        the ``j``-th vertex of the Hasse diagram
+        """
+        return bool(_column(self._leq_bm()[i], j))
+
+    @cached_method
+    def _upper_cov_bm(self):
+        r"""
+        Return the upper covers of all elements as an array of bitsets
+
+        The ``i``-th row is a bitset whose ``j``-th bit is set
+        if and only if the ``j``-th element covers the ``i``-th element.
+        """
+        return self._tables()["upper_cov_bm"]
+
+    @cached_method
+    def _lower_cov_bm(self):
+        r"""
+        Return the lower covers of all elements as an array of bitsets
+
+        The ``i``-th row is a bitset whose ``j``-th bit is set
+        if and only if the ``i``-th element covers the ``j``-th element.
+        """
+        return self._tables()["lower_cov_bm"]
+
+    @cached_method
+    def _plus_vertices(self):
+        r"""
+        Return the array of vertices of :meth:`plus` of all vertices
+        of the Hasse diagram
+        """
+        n = self.cardinality()
+        return np.fromiter((self._plus_idx(i) for i in range(n)),
+                           dtype = np.int64, count = n)
+
+    @cached_method
+    def _minus_vertices(self):
+        r"""
+        Return the array of vertices of :meth:`minus` of all vertices
+        of the Hasse diagram
+        """
+        n = self.cardinality()
+        return np.fromiter((self._minus_idx(i) for i in range(n)),
+                           dtype = np.int64, count = n)
+
+    def _ice_itv_indices(self):
+        r"""
+        Return all ICE intervals as a pair ``(I, J)`` of arrays of vertices
+        of the Hasse diagram
+
+        An interval $[U,T]$ is ICE if and only if $T \leq U^{+}$,
+        so the ``U``-th row of the mask below is the set of such ``T``.
+        """
+        mask = self._leq_bm() & self._geq_bm()[self._plus_vertices()]
+        return _nonzero_bits(mask, self.cardinality())
+
+    def _ike_itv_indices(self):
+        r"""
+        Return all IKE intervals as a pair ``(I, J)`` of arrays of vertices
+        of the Hasse diagram
+
+        An interval $[U,T]$ is IKE if and only if $T^{-} \leq U$,
+        so the ``T``-th row of the mask below is the set of such ``U``.
+        """
+        mask = self._geq_bm() & self._leq_bm()[self._minus_vertices()]
+        J, I = _nonzero_bits(mask, self.cardinality())
+        return I, J
+
+    def _join_idx(self, vertices):
+        r"""
+        Return the vertex of the join of elements given by ``vertices``
+
+        The join is the unique common upper bound whose row in
+        :meth:`_leq_bm` coincides with the bitset of all common upper bounds.
+
+        INPUT:
+
+        - ``vertices`` -- a list or an array of vertices of the Hasse diagram
+        """
+        if len(vertices) == 0:
+            return self._element_to_vertex(self.zero())
+        leq_bm = self._leq_bm()
+        upper = np.bitwise_and.reduce(leq_bm[vertices], axis = 0)
+        candidates = _bits(upper)
+        return int(candidates[(leq_bm[candidates] == upper).all(axis = 1)][0])
+
+    def _meet_idx(self, vertices):
+        r"""
+        Return the vertex of the meet of elements given by ``vertices``
+
+        This is dual to :meth:`_join_idx`.
+
+        INPUT:
+
+        - ``vertices`` -- a list or an array of vertices of the Hasse diagram
+        """
+        if len(vertices) == 0:
+            return self._element_to_vertex(self.whole())
+        geq_bm = self._geq_bm()
+        lower = np.bitwise_and.reduce(geq_bm[vertices], axis = 0)
+        candidates = _bits(lower)
+        return int(candidates[(geq_bm[candidates] == lower).all(axis = 1)][0])
+
+    def _itv_indices(self):
+        r"""
+        Return all intervals as a pair ``(I, J)`` of arrays of vertices
+        of the Hasse diagram, i.e. ``I[k]`` is smaller than or equal to ``J[k]``
+        """
+        return _nonzero_bits(self._leq_bm(), self.cardinality())
+
     @cached_method
     def all_itvs(self):
         """
         Return the set of all intervals in the torsion poset
         """
-        return {(U,T) for U in self for T in self if self.is_lequal(U,T)}
+        elt = self._vertex_to_element
+        return {(elt(i), elt(j)) for i, j in zip(*self._itv_indices())}
 
     @cached_method
     def simples(self):
@@ -238,7 +691,108 @@ class FiniteTorsLattice(FiniteLatticePoset):
            J. Pure Appl. Algebra 225 (2021), no. 9, 106642.
         """
         T = self(T) # Make sure that it is an element of `self`
-        return _extended_kappa(self, T)
+        m = self._kappa_idx(self._element_to_vertex(T))
+        return None if m is None else self._vertex_to_element(m)
+
+    def _kappa_idx(self, i):
+        r"""
+        Return the vertex of :meth:`kappa` of the ``i``-th vertex
+        of the Hasse diagram, or ``None`` if it does not exist
+        """
+        position = self._brick_position()
+        kappa_vtx = self._tables()["kappa_vtx"]
+        if i in position:
+            return kappa_vtx[position[i]]
+        CJR = _canonical_joinands_table(self)[i]
+        if CJR is None:
+            return None
+        # Canonical joinands are join-irreducible, so their kappa are in the table.
+        kappa_CJR = [kappa_vtx[position[j]] for j in CJR]
+        if any(m is None for m in kappa_CJR):
+            return None
+        return self._meet_idx(kappa_CJR)
+
+    @cached_method
+    def _brick_list(self):
+        r"""
+        Return the tuple of all bricks (join-irreducibles) sorted by
+        their vertices in the Hasse diagram
+
+        This fixes the numbering of bricks used in bitsets of bricks,
+        see :meth:`_bricks_leq`.
+        """
+        return tuple(self._vertex_to_element(v)
+                     for v in self._tables()["brick_vtx"])
+
+    @cached_method
+    def _brick_position(self):
+        r"""
+        Return the dictionary sending the vertex of each brick
+        to its position in :meth:`_brick_list`
+        """
+        return {v: k for k, v in enumerate(self._tables()["brick_vtx"])}
+
+    @cached_method
+    def _bricks_leq(self):
+        r"""
+        Return the pair of arrays of bitsets encoding bricks in torsion classes
+        and torsion-free classes
+
+        Let $j_k$ be the ``k``-th element of :meth:`_brick_list`.
+        This returns a pair ``(tors_bm, torf_bm)`` of arrays of bitsets such that
+        the ``k``-th bit of ``tors_bm[T]`` is set iff $j_k \leq T$, and
+        the ``k``-th bit of ``torf_bm[T]`` is set iff $T \leq \kappa(j_k)$,
+        where ``T`` is a vertex of the Hasse diagram.
+        """
+        tables = self._tables()
+        return tables["tors_bm"], tables["torf_bm"]
+
+    def _decode_vertices(self, row):
+        r"""
+        Return the set of elements whose vertices are set in a bitset ``row``
+        """
+        elt = self._vertex_to_element
+        return {elt(int(i)) for i in _bits(row)}
+
+    def _decode_bricks(self, row):
+        r"""
+        Return the frozenset of bricks whose bits are set in a bitset ``row``
+        """
+        brick_list = self._brick_list()
+        return frozenset(brick_list[k] for k in _bits(row))
+
+    def _bricks_bm(self, i, j):
+        r"""
+        Return the bitset of bricks in the heart of an interval
+        given by vertices ``i`` and ``j`` of the Hasse diagram
+        """
+        tors_bm, torf_bm = self._bricks_leq()
+        return tors_bm[j] & torf_bm[i]
+
+    def _hearts(self, I, J):
+        r"""
+        Return the distinct hearts of intervals together with inclusions among them
+
+        INPUT:
+
+        - ``I``, ``J`` -- arrays of vertices of the Hasse diagram
+          such that each ``(I[k], J[k])`` is an interval
+
+        OUTPUT:
+
+        a pair ``(hearts, inclusions)``, where ``hearts`` is the list of
+        distinct frozensets of bricks in the hearts of the given intervals,
+        and ``inclusions`` is the list of pairs ``(X,Y)`` in ``hearts``
+        such that ``Y`` covers ``X`` with respect to inclusion
+        """
+        tors_bm, torf_bm = self._bricks_leq()
+        bms = np.unique(tors_bm[J] & torf_bm[I], axis = 0)
+        hearts = [self._decode_bricks(bm) for bm in bms]
+        subset = _subset_matrix(bms)
+        np.fill_diagonal(subset, False)
+        covers = _cover_matrix(subset)
+        inclusions = [(hearts[a], hearts[b]) for a, b in zip(*np.nonzero(covers))]
+        return hearts, inclusions
 
     @cached_method
     def bricks_in_tors(self, T):
@@ -256,7 +810,14 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         """
         T = self(T) # Make sure that it is an element of `self`
-        return frozenset({j for j in self.all_bricks() if self.is_lequal(j,T)})
+        return self._bricks_in_tors_idx(self._element_to_vertex(T))
+
+    def _bricks_in_tors_idx(self, j):
+        r"""
+        Return :meth:`bricks_in_tors` of the ``j``-th vertex of the Hasse diagram
+        """
+        tors_bm, _ = self._bricks_leq()
+        return self._decode_bricks(tors_bm[j])
 
     @cached_method
     def bricks_in_torf(self, T):
@@ -274,8 +835,32 @@ class FiniteTorsLattice(FiniteLatticePoset):
         i.e. $T^\perp$
         """
         T = self(T) # Make sure that it is an element of `self`
-        return frozenset(j for j in self.all_bricks()
-                         if self.is_gequal(self.kappa(j),T) )
+        return self._bricks_in_torf_idx(self._element_to_vertex(T))
+
+    def _bricks_in_torf_idx(self, i):
+        r"""
+        Return :meth:`bricks_in_torf` of the ``i``-th vertex of the Hasse diagram
+        """
+        _, torf_bm = self._bricks_leq()
+        return self._decode_bricks(torf_bm[i])
+
+    def _itv_to_vertices(self, itv, *, check = True):
+        r"""
+        Return the pair of vertices of the Hasse diagram corresponding to ``itv``
+
+        INPUT:
+
+        - ``itv`` -- a pair (tuple) of torsion classes
+
+        - ``check`` -- a Boolean (default: ``True``),
+          whether to check ``itv`` is actually an interval
+        """
+        U, T = itv
+        U, T = self(U), self(T) # Make sure that they are elements of `self`
+        i, j = self._element_to_vertex(U), self._element_to_vertex(T)
+        if check and not self._lequal_idx(i, j):
+            raise ValueError("This is not an interval.")
+        return i, j
 
     @cached_method
     def bricks(self, itv, *, check = True):
@@ -303,11 +888,15 @@ class FiniteTorsLattice(FiniteLatticePoset):
            ICE-closed subcategories and wide $\tau$-tilting modules,
            to appear in Math. Z.
         """
-        U, T = itv
-        U, T = self(U), self(T) # Make sure that they are elements of `self`
-        if check and not self.is_lequal(U,T):
-            raise ValueError("This is not an interval.")
-        return self.bricks_in_tors(T) & self.bricks_in_torf(U)
+        i, j = self._itv_to_vertices(itv, check = check)
+        return self._bricks_idx(i, j)
+
+    def _bricks_idx(self, i, j):
+        r"""
+        Return :meth:`bricks` of an interval given by vertices ``i`` and ``j``
+        of the Hasse diagram, which is assumed to be an interval
+        """
+        return self._decode_bricks(self._bricks_bm(i, j))
 
     @cached_method
     def label(self, itv, *, check = True):
@@ -329,11 +918,19 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         .. [DIRRT] L. Demonet, O. Iyama, N. Reading, I. Reiten, H. Thomas, Lattice theory of torsion classes, arXiv:1711.01785.
         """
-        bricks_in = self.bricks(itv)
-        if check and len(bricks_in) > 1:
-            raise ValueError("The heart contains more than one brick, \
+        i, j = self._itv_to_vertices(itv)
+        return self._label_idx(i, j, check = check)
+
+    def _label_idx(self, i, j, *, check = True):
+        r"""
+        Return :meth:`label` of a Hasse arrow given by vertices ``i`` and ``j``
+        of the Hasse diagram
+        """
+        bricks_in = self._bricks_idx(i, j)
+        if check and len(bricks_in) != 1:
+            raise ValueError("The heart does not consist of exactly one brick, \
                              so not a covering relation.")
-        return list(bricks_in)[0]
+        return next(iter(bricks_in))
 
     @cached_method
     def plus(self, U):
@@ -349,10 +946,16 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``U`` -- an element (torsion class) of ``self``
         """
         U = self(U) # Make sure that it is an element of `self`
-        if U == self.whole():
-            return U
-        upper = self.upper_covers(U)
-        return self.join(upper)
+        return self._vertex_to_element(self._plus_idx(self._element_to_vertex(U)))
+
+    def _plus_idx(self, i):
+        r"""
+        Return the vertex of :meth:`plus` of the ``i``-th vertex of the Hasse diagram
+        """
+        upper = _bits(self._upper_cov_bm()[i])
+        if len(upper) == 0:
+            return i
+        return self._join_idx(upper)
 
     @cached_method
     def minus(self, T):
@@ -368,10 +971,16 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``T`` -- an element (torsion class) of ``self``
         """
         T = self(T) # Make sure that it is an element of `self`
-        if T == self.zero():
-            return T
-        lower = self.lower_covers(T)
-        return self.meet(lower)
+        return self._vertex_to_element(self._minus_idx(self._element_to_vertex(T)))
+
+    def _minus_idx(self, j):
+        r"""
+        Return the vertex of :meth:`minus` of the ``j``-th vertex of the Hasse diagram
+        """
+        lower = _bits(self._lower_cov_bm()[j])
+        if len(lower) == 0:
+            return j
+        return self._meet_idx(lower)
 
     def is_wide_itv(self, itv, *, check = True):
         r"""
@@ -396,14 +1005,18 @@ class FiniteTorsLattice(FiniteLatticePoset):
            Wide subcategories and lattices of torsion classes,
            arXiv:1905.01148.
         """
-        U, T = itv
-        U, T = self(U), self(T) # Make sure that they are elements of `self`
-        if check and not self.is_lequal(U,T):
-            raise ValueError("This is not an interval.")
-        if U == T:
+        i, j = self._itv_to_vertices(itv, check = check)
+        return self._is_wide_itv_idx(i, j)
+
+    def _is_wide_itv_idx(self, i, j):
+        r"""
+        Return :meth:`is_wide_itv` of an interval given by vertices ``i`` and ``j``
+        of the Hasse diagram
+        """
+        if i == j:
             return True
-        covers = [x for x in self.upper_covers(U) if self.is_lequal(x,T)]
-        return T == self.join(covers)
+        covers = _bits(self._upper_cov_bm()[i] & self._geq_bm()[j])
+        return j == self._join_idx(covers)
 
     def is_ice_itv(self, itv, *, check = True):
         r"""
@@ -429,11 +1042,15 @@ class FiniteTorsLattice(FiniteLatticePoset):
            ICE-closed subcategories and wide $\tau$-tilting modules,
            to appear in Math. Z.
         """
-        U,T = itv
-        U, T = self(U), self(T) # Make sure that they are elements of `self`
-        if check and not self.is_lequal(U,T):
-            raise ValueError("This is not an interval.")
-        return self.is_lequal(T,self.plus(U))
+        i, j = self._itv_to_vertices(itv, check = check)
+        return self._is_ice_itv_idx(i, j)
+
+    def _is_ice_itv_idx(self, i, j):
+        r"""
+        Return :meth:`is_ice_itv` of an interval given by vertices ``i`` and ``j``
+        of the Hasse diagram
+        """
+        return self._lequal_idx(j, int(self._plus_vertices()[i]))
 
     def is_ike_itv(self, itv, *, check = True):
         r"""
@@ -452,11 +1069,15 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``check`` -- a Boolean (default: ``True``),
           whether to check ``itv`` is actually an interval
         """
-        U,T = itv
-        U, T = self(U), self(T) # Make sure that they are elements of `self`
-        if check and not self.is_lequal(U,T):
-            raise ValueError("This is not an interval.")
-        return self.is_lequal(self.minus(T),U)
+        i, j = self._itv_to_vertices(itv, check = check)
+        return self._is_ike_itv_idx(i, j)
+
+    def _is_ike_itv_idx(self, i, j):
+        r"""
+        Return :meth:`is_ike_itv` of an interval given by vertices ``i`` and ``j``
+        of the Hasse diagram
+        """
+        return self._lequal_idx(int(self._minus_vertices()[j]), i)
 
     def itv_lequal(self, itv1, itv2):
         r"""
@@ -476,7 +1097,7 @@ class FiniteTorsLattice(FiniteLatticePoset):
         ``True`` if the heart of ``itv1`` is contained in that of ``itv2``,
         and ``False`` otherwise.
         """
-        return set(self.bricks(itv1)).issubset(self.bricks(itv2))
+        return self.bricks(itv1).issubset(self.bricks(itv2))
 
     def wide_simples(self, itv):
         """
@@ -490,13 +1111,12 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         the set of simple objects (bricks represented by join-irreducibles) of a wide subcategory which is the heart of ``itv``
         """
-        U, T = itv
-        U, T = self(U), self(T) # Make sure that they are elements of `self`
-        if not self.is_wide_itv((U,T)):
+        i, j = self._itv_to_vertices(itv)
+        if not self._is_wide_itv_idx(i, j):
             raise ValueError("This interval is not a wide interval.")
 
-        covers = [x for x in self.upper_covers(U) if self.is_lequal(x,T)]
-        return {self.label((U,x), check = False) for x in covers}
+        covers = _bits(self._upper_cov_bm()[i] & self._geq_bm()[j])
+        return {self._label_idx(i, int(x), check = False) for x in covers}
 
     def wide_lequal(self, U, T):
         r"""
@@ -529,8 +1149,33 @@ class FiniteTorsLattice(FiniteLatticePoset):
            arXiv:2005.01626.
         """
         U, T = self(U), self(T) # Make sure that they are elements of `self`
-        kappa_U, kappa_T = self.kappa(U), self.kappa(T)
-        return self.is_lequal(U, T) and self.is_gequal(kappa_U, kappa_T)
+        i, j = self._element_to_vertex(U), self._element_to_vertex(T)
+        return bool(self._wide_lequal_matrix()[i, j])
+
+    @cached_method
+    def _kappa_vertices(self):
+        r"""
+        Return the array of vertices of :meth:`kappa` of all vertices
+        of the Hasse diagram
+        """
+        n = self.cardinality()
+        kappa_vtx = [self._kappa_idx(i) for i in range(n)]
+        if None in kappa_vtx:
+            raise ValueError("This lattice is not semidistributive.")
+        return np.array(kappa_vtx, dtype = np.int64)
+
+    @cached_method
+    def _wide_lequal_matrix(self):
+        r"""
+        Return the Boolean matrix representing :meth:`wide_lequal`
+
+        The ``(i,j)``-entry is ``True`` if and only if the ``i``-th vertex
+        is smaller than or equal to the ``j``-th vertex and
+        the kappa of the ``j``-th vertex is smaller than or equal to
+        that of the ``i``-th vertex.
+        """
+        leq, kappa_vtx = self._leq_mat(), self._kappa_vertices()
+        return leq & leq[np.ix_(kappa_vtx, kappa_vtx)].T
 
     def wide_lattice(self):
         """
@@ -543,7 +1188,12 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         an instance of :class:`sage.combinat.posets.lattices.FiniteLatticePoset`
         """
-        return LatticePoset((self, self.wide_lequal))
+        less = self._wide_lequal_matrix().copy()
+        np.fill_diagonal(less, False)
+        elt = self._vertex_to_element
+        elements = [elt(i) for i in range(self.cardinality())]
+        covers = [(elt(i), elt(j)) for i, j in zip(*np.nonzero(_cover_matrix(less)))]
+        return LatticePoset((elements, covers), cover_relations = True)
 
     def ice_lattice(self):
         """
@@ -563,9 +1213,8 @@ class FiniteTorsLattice(FiniteLatticePoset):
            ICE-closed subcategories and wide $\tau$-tilting modules,
            to appear in Math. Z.
         """
-        ice_bricks = {self.bricks(itv, check = False) for itv in self.all_itvs()
-                      if self.is_ice_itv(itv, check = False)}
-        return LatticePoset((ice_bricks, attrcall("issubset")))
+        return LatticePoset(self._hearts(*self._ice_itv_indices()),
+                            cover_relations = True)
 
     def ike_lattice(self):
         """
@@ -579,9 +1228,8 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         an instance of :class:`sage.combinat.posets.lattices.FiniteLatticePoset`
         """
-        ike_bricks = {self.bricks(itv, check = False) for itv in self.all_itvs()
-                      if self.is_ike_itv(itv, check = False)}
-        return LatticePoset((ike_bricks, attrcall("issubset")))
+        return LatticePoset(self._hearts(*self._ike_itv_indices()),
+                            cover_relations = True)
 
     def heart_poset(self):
         """
@@ -599,8 +1247,7 @@ class FiniteTorsLattice(FiniteLatticePoset):
 
         an instance of :class:`sage.combinat.posets.posets.FinitePoset`
         """
-        brick_set = {self.bricks(itv, check = False) for itv in self.all_itvs()}
-        return Poset((brick_set, attrcall("issubset")))
+        return Poset(self._hearts(*self._itv_indices()), cover_relations = True)
 
     def indec_tau_rigid(self):
         r"""
@@ -645,10 +1292,23 @@ class FiniteTorsLattice(FiniteLatticePoset):
         M = self(M) # Make sure that it is an element of `self`
         if check and M not in self.indec_tau_rigid():
             raise ValueError("This is not join-irreducible.")
-        M_plus = self.plus(M)
-        # then [M, M_plus] is the set of tau-tilting pairs
-        # containing (M,0) as a summand.
-        return {T for T in self if self.is_lequal(M,T) and self.is_lequal(T,M_plus) }
+        m = self._element_to_vertex(M)
+        # [M, M^+] is the set of tau-tilting pairs containing (M,0) as a summand.
+        return self._decode_vertices(
+            self._leq_bm()[m] & self._geq_bm()[self._plus_vertices()[m]])
+
+    @cached_method
+    def _tau_rigid_summand_bm(self):
+        r"""
+        Return the array of bitsets representing :meth:`has_tau_rigid_summand`
+
+        The ``k``-th row is the bitset of vertices of the Hasse diagram
+        in :meth:`has_tau_rigid_summand` of the ``k``-th element $M$ of
+        :meth:`_brick_list`, that is, the interval $[M, M^{+}]$.
+        """
+        brick_vtx = list(self._tables()["brick_vtx"])
+        plus_vtx = self._plus_vertices()[brick_vtx]
+        return self._leq_bm()[brick_vtx] & self._geq_bm()[plus_vtx]
 
     @cached_method
     def has_support_summand(self, S, *, check = True):
@@ -673,14 +1333,56 @@ class FiniteTorsLattice(FiniteLatticePoset):
         S = self(S) # Make sure that it is an element of `self`
         if check and S not in self.simples():
             raise ValueError("This is not a simple torsion class (doesn't cover 0).")
-        # We compute the Serre subcategory ``non_S_Serre`` consisting of modules
-        # such that ``S`` don't appear as composition factors.
-        non_S_simple = set(self.simples()) - {S}
-        non_S_Serre = self.join(non_S_simple)
-        # Then a $\tau$-tilting pair contains $(0,P)$ as a summand
+        return self._decode_vertices(
+            self._support_summand_bm_idx(self._element_to_vertex(S)))
+
+    def _support_summand_bm_idx(self, s):
+        r"""
+        Return the bitset of vertices of the Hasse diagram in
+        :meth:`has_support_summand` of the ``s``-th vertex
+        """
+        # A $\tau$-tilting pair contains $(0,P)$ as a summand
         # if there's no non-zero map from P to any element in the corresponding torsion class $T$,
         # that is, $T$ is contained in ``non_S_Serre``.
-        return {T for T in self if self.is_lequal(T,non_S_Serre)}
+        return self._geq_bm()[self._non_S_serre_table()[s]]
+
+    @cached_method
+    def _non_S_serre_table(self):
+        r"""
+        Return the dictionary sending the vertex of each simple torsion class ``S``
+        to the vertex of the Serre subcategory ``non_S_Serre``
+
+        Here ``non_S_Serre`` consists of modules such that ``S`` don't appear
+        as composition factors, that is, the join of all simples except ``S``.
+        """
+        simple_vtx = self._simple_vertices()
+        return {s: self._join_idx([t for t in simple_vtx if t != s])
+                for s in simple_vtx}
+
+    @cached_method
+    def _simple_vertices(self):
+        r"""
+        Return the sorted tuple of vertices of :meth:`simples` in the Hasse diagram
+
+        This fixes the numbering of simples used in :meth:`_comp_factor_bm`.
+        """
+        zero = self._element_to_vertex(self.zero())
+        return tuple(int(s) for s in _bits(self._upper_cov_bm()[zero]))
+
+    @cached_method
+    def _comp_factor_bm(self):
+        r"""
+        Return the array of bitsets representing :meth:`composition_factors`
+
+        The ``k``-th bit of the ``t``-th row is set if and only if
+        the ``k``-th element of :meth:`_simple_vertices` is a composition factor
+        of the ``t``-th vertex of the Hasse diagram,
+        that is, the ``t``-th vertex is not in :meth:`has_support_summand` of it.
+        """
+        non_S_serre = self._non_S_serre_table()
+        support = self._geq_bm()[[non_S_serre[s] for s in self._simple_vertices()]]
+        in_support = _unpack_rows(support, self.cardinality())
+        return _pack_rows(~in_support.T)
 
     def projectives(self, T):
         r"""
@@ -695,8 +1397,15 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``T`` -- an element (torsion class) of ``self``
         """
         T = self(T) # Make sure that it is an element of `self`
-        return {M for M in self.indec_tau_rigid()
-                if T in self.has_tau_rigid_summand(M, check = False)}
+        return self._projectives_idx(self._element_to_vertex(T))
+
+    def _projectives_idx(self, t):
+        r"""
+        Return :meth:`projectives` of the ``t``-th vertex of the Hasse diagram
+        """
+        brick_list = self._brick_list()
+        in_summand = _column(self._tau_rigid_summand_bm(), t)
+        return {brick_list[k] for k in np.flatnonzero(in_summand)}
 
     def composition_factors(self, T):
         r"""
@@ -710,7 +1419,9 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``T`` -- an element (torsion class) of ``self``
         """
         T = self(T) # Make sure that it is an element of `self`
-        return {S for S in self.simples() if T not in self.has_support_summand(S, check = False)}
+        simple_vtx = self._simple_vertices()
+        row = self._comp_factor_bm()[self._element_to_vertex(T)]
+        return {self._vertex_to_element(simple_vtx[k]) for k in _bits(row)}
 
     def is_sincere(self, T):
         r"""
@@ -721,7 +1432,14 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``T`` -- an element (torsion class) of ``self``
         """
         T = self(T) # Make sure that it is an element of `self`
-        return len(self.composition_factors(T)) == len(self.simples())
+        return self._is_sincere_idx(self._element_to_vertex(T))
+
+    def _is_sincere_idx(self, t):
+        r"""
+        Return :meth:`is_sincere` of the ``t``-th vertex of the Hasse diagram
+        """
+        row = self._comp_factor_bm()[t]
+        return len(_bits(row)) == len(self._simple_vertices())
 
     def tau_rigid_pair_summand(self, T):
         r"""
@@ -740,9 +1458,19 @@ class FiniteTorsLattice(FiniteLatticePoset):
         - ``T`` -- an element of ``self`` considered as a $\tau$-tilting pair
         """
         T = self(T) # Make sure that it is an element of `self`
-        return {(M,0) for M in self.projectives(T)} | \
-               {(S,1) for S in self.simples()
-                if T in self.has_support_summand(S, check = False)}
+        return set(self._tau_rigid_pair_summand_idx(self._element_to_vertex(T)))
+
+    def _tau_rigid_pair_summand_idx(self, t):
+        r"""
+        Return the tuple of :meth:`tau_rigid_pair_summand` of the ``t``-th vertex
+        of the Hasse diagram
+        """
+        summands = [(M,0) for M in self._projectives_idx(t)]
+        comp_factors = self._comp_factor_bm()[t]
+        for k, s in enumerate(self._simple_vertices()):
+            if not _column(comp_factors, k):
+                summands.append((self._vertex_to_element(s),1))
+        return tuple(summands)
 
     def s_tau_tilt_complex(self):
         r"""
@@ -766,7 +1494,8 @@ class FiniteTorsLattice(FiniteLatticePoset):
            Simplicial complexes and tilting theory for Brauer tree algebras,
            J. Algebra 551 (2020), 119--153.
         """
-        return SimplicialComplex([self.tau_rigid_pair_summand(T) for T in self],
+        n = self.cardinality()
+        return SimplicialComplex((self._tau_rigid_pair_summand_idx(t) for t in range(n)),
                                  maximality_check = False)
 
     def positive_tau_tilt_complex(self):
@@ -798,7 +1527,9 @@ class FiniteTorsLattice(FiniteLatticePoset):
            Shellability of simplicial complexes arising in representation theory,
            Adv. Math. 144 (1999), no. 2, 221--246.
         """
-        return SimplicialComplex([self.projectives(T) for T in self if self.is_sincere(T)],
+        n = self.cardinality()
+        return SimplicialComplex((tuple(self._projectives_idx(t)) for t in range(n)
+                                  if self._is_sincere_idx(t)),
                                  maximality_check = False)
 
 
@@ -828,5 +1559,7 @@ class FiniteTorsLattice(FiniteLatticePoset):
             U, T = self.zero(), arg
         U, T = self(U), self(T) # Make sure that they are elements of `self`
 
-        T_minus_U = {M for M in self.projectives(T) if not self.is_lequal(M,U)}
+        leq, to_vtx = self._leq_mat(), self._element_to_vertex
+        u = to_vtx(U)
+        T_minus_U = {M for M in self._projectives_idx(to_vtx(T)) if not leq[to_vtx(M), u]}
         return len(T_minus_U)